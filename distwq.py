@@ -40,6 +40,7 @@ import signal
 import sys
 import time
 import traceback
+from collections import OrderedDict, deque
 from enum import IntEnum
 from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
@@ -58,6 +59,8 @@ class MessageTag(IntEnum):
     DONE = 1
     TASK = 2
     EXIT = 3
+    TASK_CHUNK = 4
+    DONE_CHUNK = 5
 
 
 class GroupingMethod(IntEnum):
@@ -66,6 +69,12 @@ class GroupingMethod(IntEnum):
     GroupSplit = 2
 
 
+class WaitStrategy(IntEnum):
+    BusyPoll = 1
+    Backoff = 2
+    Blocking = 3
+
+
 logger = logging.getLogger(__name__)
 
 # try to get the communicator object to see whether mpi is available:
@@ -152,12 +161,176 @@ def multiple_task_arguments(N, args, kwargs, task_ids, workers):
     return args, kwargs, task_ids, workers
 
 
+def wait_for_message(
+    comm: Intracomm,
+    source: int = MPI.ANY_SOURCE,
+    tag: int = MPI.ANY_TAG,
+    status: Optional[Any] = None,
+    wait_strategy: WaitStrategy = WaitStrategy.Backoff,
+    backoff_max: float = 0.01,
+    timeout: Optional[float] = None,
+) -> Optional[Any]:
+    """
+    Wait for an incoming message matching source and tag.
+
+    Returns a matched message handle (to be received with its recv()
+    method) as soon as a message is available, or None if the timeout
+    expires first.
+
+    BusyPoll probes continuously, Backoff probes with an exponentially
+    increasing delay capped at backoff_max seconds, and Blocking waits
+    in a blocking matched probe (falling back to Backoff when a timeout
+    is given).
+    """
+    msg = comm.improbe(source=source, tag=tag, status=status)
+    if msg is not None:
+        return msg
+    if (wait_strategy == WaitStrategy.Blocking) and (timeout is None):
+        return comm.mprobe(source=source, tag=tag, status=status)
+    wait_start = time.time()
+    delay = min(1e-5, backoff_max)
+    while msg is None:
+        if timeout is not None:
+            remaining = timeout - (time.time() - wait_start)
+            if remaining <= 0.0:
+                break
+        if wait_strategy != WaitStrategy.BusyPoll:
+            time.sleep(delay if timeout is None else min(delay, remaining))
+            delay = min(2.0 * delay, backoff_max)
+        msg = comm.improbe(source=source, tag=tag, status=status)
+    return msg
+
+
+class IndexedPriorityQueue(object):
+    """
+    Binary min-heap of items keyed by priority, with an index from
+    item to heap position so that the priority of an item can be
+    updated and any item can be removed in O(log n). Items with equal
+    priority are returned in insertion order.
+    """
+
+    def __init__(self) -> None:
+        self.heap: List[List[Any]] = []
+        """(list) heap entries [priority, insertion count, item]"""
+        self.index: Dict[Any, int] = {}
+        """(dictionary) index[item] is the position of item in the heap"""
+        self.count = 0
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+    def __contains__(self, item: Any) -> bool:
+        return item in self.index
+
+    def __iter__(self):
+        return iter(list(self.index))
+
+    def push(self, item: Any, priority: float) -> None:
+        """
+        Insert item with the given priority, or update its priority if
+        it is already in the queue.
+        """
+        if item in self.index:
+            self.update(item, priority)
+            return
+        self.heap.append([priority, self.count, item])
+        self.count += 1
+        self.index[item] = len(self.heap) - 1
+        self._sift_up(len(self.heap) - 1)
+
+    def peek(self) -> Any:
+        """
+        Return the item with the smallest priority.
+        """
+        return self.heap[0][2]
+
+    def pop(self) -> Any:
+        """
+        Remove and return the item with the smallest priority.
+        """
+        item = self.heap[0][2]
+        self.remove(item)
+        return item
+
+    def remove(self, item: Any) -> None:
+        """
+        Remove item from the queue.
+        """
+        pos = self.index.pop(item)
+        last = self.heap.pop()
+        if pos < len(self.heap):
+            self.heap[pos] = last
+            self.index[last[2]] = pos
+            self._sift_up(pos)
+            self._sift_down(self.index[last[2]])
+
+    def update(self, item: Any, priority: float) -> None:
+        """
+        Change the priority of an item in the queue.
+        """
+        pos = self.index[item]
+        old_priority = self.heap[pos][0]
+        self.heap[pos][0] = priority
+        if priority < old_priority:
+            self._sift_up(pos)
+        else:
+            self._sift_down(pos)
+
+    def _swap(self, i: int, j: int) -> None:
+        self.heap[i], self.heap[j] = self.heap[j], self.heap[i]
+        self.index[self.heap[i][2]] = i
+        self.index[self.heap[j][2]] = j
+
+    def _sift_up(self, pos: int) -> None:
+        while pos > 0:
+            parent = (pos - 1) // 2
+            if self.heap[pos][:2] < self.heap[parent][:2]:
+                self._swap(pos, parent)
+                pos = parent
+            else:
+                break
+
+    def _sift_down(self, pos: int) -> None:
+        n = len(self.heap)
+        while True:
+            smallest = pos
+            for child in (2 * pos + 1, 2 * pos + 2):
+                if (child < n) and (self.heap[child][:2] < self.heap[smallest][:2]):
+                    smallest = child
+            if smallest == pos:
+                break
+            self._swap(pos, smallest)
+            pos = smallest
+
+
 class MPIController(object):
-    def __init__(self, comm: Intracomm, time_limit: Any = None) -> None:
+    def __init__(
+        self,
+        comm: Intracomm,
+        time_limit: Any = None,
+        wait_strategy: WaitStrategy = WaitStrategy.Backoff,
+        backoff_max: float = 0.01,
+        dispatch_threshold: Optional[int] = None,
+    ) -> None:
         size = comm.size
 
         self.comm = comm
         self.workers_available = True if size > 1 else False
+        self.wait_strategy = wait_strategy
+        self.backoff_max = backoff_max
+        self.dispatch_threshold = dispatch_threshold
+        """
+        (int or None) if not None, submit_call() only puts calls on the wait
+        queue, and waiting calls are submitted to workers once this many calls
+        have been queued since the last submission pass, or when flush() or
+        process() is called.
+        """
+        self.n_queued = 0
+        """(int) number of calls put on the wait queue since the last submission pass"""
+        self.last_wait_time = 0.0
+        """(float) time spent waiting for a message in the last call to process()"""
+        self.total_wait_time = 0.0
+        """(float) total time spent waiting for messages in process()"""
 
         self.count = 0
 
@@ -171,9 +344,12 @@ class MPIController(object):
         On worker i, only total_time_est[i] is available.
         """
         self.total_time_est[0] = np.inf
-        self.result_queue: List[int] = []
-        self.task_queue: List[int] = []
-        self.wait_queue: List[int] = []
+        self.result_queue: OrderedDict[int, None] = OrderedDict()
+        """(ordered dict used as ordered set) ids of calls with results ready"""
+        self.task_queue: OrderedDict[int, None] = OrderedDict()
+        """(ordered dict used as ordered set) ids of calls submitted to workers"""
+        self.wait_queue: deque = deque()
+        """(deque) ids of calls waiting for a ready worker"""
         self.waiting: Dict[
             int,
             Tuple[
@@ -185,17 +361,27 @@ class MPIController(object):
                 Optional[int],
             ],
         ] = {}
-        self.ready_workers: List[int] = []
+        self.ready_workers = IndexedPriorityQueue()
+        """
+        (indexed priority queue) ids of workers that are ready, keyed by
+        total_time_est, so that the least loaded ready worker is found in
+        O(log n)
+        """
         self.ready_workers_data: Dict[int, Any] = {}
-        """(list) ids of submitted calls"""
+        self.chunks: Dict[int, List[int]] = {}
+        """
+        (dictionary)
+        chunks[id] contains the ids of the calls in the chunk whose first call
+        has that id; only the first call of a chunk is on the wait queue.
+        """
         self.assigned = {}
         """
         (dictionary)
         assigned[id] is the worker assigned to the call with that id.
         """
-        self.worker_queue = [[] for i in range(0, size)]
+        self.worker_queue = [OrderedDict() for i in range(0, size)]
         """
-        (list of lists)
+        (list of ordered dicts used as ordered sets)
         worker_queue[i] contains the ids of calls assigned to worker i.
         """
         self.active_workers = set([])
@@ -235,24 +421,51 @@ class MPIController(object):
         - "total_time": total wall time until this call was finished
         """
 
-    def process(self, limit: int = 1000) -> List[Union[int, Any]]:
+    def process(
+        self, limit: int = 1000, block: bool = True, timeout: Optional[float] = None
+    ) -> List[Union[int, Any]]:
         """
         Process incoming messages.
+
+        Receives all pending READY and DONE messages and submits waiting
+        calls to ready workers. If no message is pending and calls are
+        outstanding, waits for the next message according to the wait
+        strategy of the controller, and returns as soon as it has been
+        processed. The time spent waiting is stored in last_wait_time and
+        accumulated in total_wait_time.
+
+        :arg int limit: maximum number of results to receive in one call.
+        :arg bool block: whether to wait for a message if none is pending.
+        :arg float timeout: maximum time to wait, in seconds, or None to
+            wait until a message arrives.
+        :return object: ids of waiting calls submitted to workers.
         """
         if not self.workers_available:
             return
+        self.last_wait_time = 0.0
         count = 0
-        while self.comm.Iprobe(source=MPI.ANY_SOURCE, tag=MPI.ANY_TAG):
-            if (limit is not None) and (limit < count):
-                break
-
-            status = MPI.Status()
-            data = self.comm.recv(source=MPI.ANY_SOURCE, tag=MPI.ANY_TAG, status=status)
+        status = MPI.Status()
+        msg = self.comm.improbe(source=MPI.ANY_SOURCE, tag=MPI.ANY_TAG, status=status)
+        if (msg is None) and block and self.expecting_messages():
+            wait_start = time.time()
+            msg = wait_for_message(
+                self.comm,
+                source=MPI.ANY_SOURCE,
+                tag=MPI.ANY_TAG,
+                status=status,
+                wait_strategy=self.wait_strategy,
+                backoff_max=self.backoff_max,
+                timeout=timeout,
+            )
+            self.last_wait_time = time.time() - wait_start
+            self.total_wait_time += self.last_wait_time
+        while msg is not None:
+            data = msg.recv()
             worker = status.Get_source()
             tag = status.Get_tag()
             if tag == MessageTag.READY.value:
                 if worker not in self.ready_workers:
-                    self.ready_workers.append(worker)
+                    self.ready_workers.push(worker, self.total_time_est[worker])
                     self.ready_workers_data[worker] = data
                     self.active_workers.add(worker)
                 logger.info(
@@ -265,22 +478,67 @@ class MPIController(object):
                     f"from worker {worker}"
                 )
 
-                self.results[task_id] = results
-                self.stats.append(stats)
-                self.n_processed[worker] = stats["n_processed"]
-                self.total_time[worker] = stats["total_time"]
-                self.task_queue.remove(task_id)
-                self.result_queue.append(task_id)
-                self.worker_queue[worker].remove(task_id)
-                self.assigned.pop(task_id)
+                self._complete_task(worker, task_id, results, stats)
                 count += 1
+            elif tag == MessageTag.DONE_CHUNK.value:
+                logger.info(
+                    f"MPI controller : received DONE message for {len(data)} tasks "
+                    f"from worker {worker}"
+                )
+                for task_id, results, stats in data:
+                    self._complete_task(worker, task_id, results, stats)
+                count += len(data)
             else:
                 raise RuntimeError(f"MPI controller : invalid message tag {tag}")
-        else:
-            time.sleep(1)
+            if (limit is not None) and (limit < count):
+                break
+            msg = self.comm.improbe(
+                source=MPI.ANY_SOURCE, tag=MPI.ANY_TAG, status=status
+            )
 
         return self.submit_waiting()
 
+    def _take_ready_worker(self, worker: int) -> None:
+        """
+        Remove worker from the ready workers after a task message was sent to it.
+        """
+        self.ready_workers.remove(worker)
+        del self.ready_workers_data[worker]
+
+    def _assign_task(self, task_id: int, worker: int, time_est: int) -> None:
+        """
+        Record that the call with the given id has been sent to worker.
+        """
+        self.task_queue[task_id] = None
+        self.worker_queue[worker][task_id] = None
+        self.assigned[task_id] = worker
+        self.total_time_est[worker] += time_est
+
+    def _complete_task(
+        self, worker: int, task_id: int, results: Any, stats: Dict[str, Any]
+    ) -> None:
+        """
+        Record the result and statistics of a call finished by worker.
+        """
+        self.results[task_id] = results
+        self.stats.append(stats)
+        self.n_processed[worker] = stats["n_processed"]
+        self.total_time[worker] = stats["total_time"]
+        del self.task_queue[task_id]
+        self.result_queue[task_id] = None
+        del self.worker_queue[worker][task_id]
+        del self.assigned[task_id]
+
+    def expecting_messages(self) -> bool:
+        """
+        Returns True if a READY or DONE message is needed to make progress,
+        i.e. calls have been submitted to workers, or calls are waiting
+        and no worker is ready.
+        """
+        return (len(self.task_queue) > 0) or (
+            (len(self.wait_queue) > 0) and (len(self.ready_workers) == 0)
+        )
+
     def submit_call(
         self,
         name_to_call: str,
@@ -295,7 +553,9 @@ class MPIController(object):
         Submit a call for parallel execution.
 
         If called by the controller and workers are available, the call is submitted
-        to a worker for asynchronous execution.
+        to a worker for asynchronous execution. If no worker is ready, or the
+        controller has a dispatch threshold, the call is put on the wait queue
+        instead (see queue_call()).
 
         If called by a worker or if no workers are available, the call is instead
         executed synchronously on this MPI node.
@@ -370,13 +630,11 @@ class MPIController(object):
             self.count += 1
         self.check_valid_task_id(task_id)
         if self.workers_available:
-            self.process()
-            if len(self.ready_workers) > 0:
+            if self.dispatch_threshold is None:
+                self.process(block=False)
+            if (self.dispatch_threshold is None) and (len(self.ready_workers) > 0):
                 if worker is None:
-                    ready_total_time_est = np.asarray(
-                        [self.total_time_est[worker] for worker in self.ready_workers]
-                    )
-                    worker = self.ready_workers[np.argmin(ready_total_time_est)]
+                    worker = self.ready_workers.peek()
                 else:
                     if worker not in self.ready_workers:
                         raise RuntimeError(f"worker {worker} is not in ready queue!")
@@ -392,11 +650,8 @@ class MPIController(object):
                     tag=MessageTag.TASK.value,
                 )
                 req.wait()
-                self.ready_workers.remove(worker)
-                del self.ready_workers_data[worker]
-                self.task_queue.append(task_id)
-                self.worker_queue[worker].append(task_id)
-                self.assigned[task_id] = worker
+                self._take_ready_worker(worker)
+                self._assign_task(task_id, worker, time_est)
             else:
                 self.queue_call(
                     name_to_call,
@@ -422,7 +677,7 @@ class MPIController(object):
                 raise
             call_time = time.time()
             self.results[task_id] = object_to_call(*args, **kwargs)
-            self.result_queue.append(task_id)
+            self.result_queue[task_id] = None
             this_time = time.time() - call_time
             self.n_processed[0] += 1
             self.total_time[0] = time.time() - start_time
@@ -436,8 +691,8 @@ class MPIController(object):
                     "total_time": self.total_time[0],
                 }
             )
+            self.total_time_est[worker] += time_est
 
-        self.total_time_est[worker] += time_est
         return task_id
 
     def queue_call(
@@ -455,7 +710,9 @@ class MPIController(object):
         If called by the controller and workers are available, the
         call is put on the wait queue and submitted to a worker when
         it is available. Method process() checks the wait queue and
-        submits calls on the wait queue.
+        submits calls on the wait queue. If the controller has a
+        dispatch threshold, flush() is called once that many calls
+        have been queued since the last submission pass.
 
         If called by a worker or if no workers are available, the call is instead
         executed synchronously on this MPI node.
@@ -501,6 +758,11 @@ class MPIController(object):
                 time_est,
                 requested_worker,
             )
+            self.n_queued += 1
+            if (self.dispatch_threshold is not None) and (
+                self.n_queued >= self.dispatch_threshold
+            ):
+                self.flush()
         else:
             # perform call on this rank if no workers are available:
             worker = 0
@@ -515,7 +777,7 @@ class MPIController(object):
                 raise
             call_time = time.time()
             self.results[task_id] = object_to_call(*args, **kwargs)
-            self.result_queue.append(task_id)
+            self.result_queue[task_id] = None
             this_time = time.time() - call_time
             self.n_processed[0] += 1
             self.total_time[0] = time.time() - start_time
@@ -532,6 +794,72 @@ class MPIController(object):
 
         return task_id
 
+    def queue_chunk(
+        self,
+        name_to_call: str,
+        args: List[Union[List[Any], Tuple[Any]]],
+        kwargs: List[Dict[Any, Any]],
+        module_name: str = "__main__",
+        time_est: int = 1,
+        task_ids: Optional[List[int]] = None,
+        requested_worker: Optional[int] = None,
+    ) -> List[int]:
+        """Submit a chunk of calls for later execution as one task message.
+
+        The calls are put on the wait queue as a single entry and sent
+        to one worker in one message. The worker performs them back to
+        back and returns all results in one message; results and
+        statistics are still recorded per call.
+
+        Can only be called by the controller when workers are available.
+
+        :arg str name_to_call: name of callable object, as in queue_call().
+        :arg list args: the positional arguments for each call.
+        :arg list kwargs: the keyword arguments for each call.
+        :arg str module_name: module of the callable object, as in queue_call().
+        :arg float time_est: estimated relative completion time of each call.
+        :type task_ids: list or None
+        :arg task_ids: unique ids for each call, or None for generated ids.
+        :type requested_worker: int > 0 and < comm.size, or None
+        :arg requested_worker: optional no. of worker to assign the chunk to.
+        :return object: ids of calls, to be used in get_result().
+        """
+        if task_ids is None:
+            task_ids = [None for _ in args]
+        chunk_task_ids = []
+        for this_args, this_kwargs, this_task_id in zip(args, kwargs, task_ids):
+            if this_task_id is None:
+                this_task_id = self.count
+                self.count += 1
+            self.check_valid_task_id(this_task_id)
+            self.waiting[this_task_id] = (
+                name_to_call,
+                this_args,
+                this_kwargs,
+                module_name,
+                time_est,
+                requested_worker,
+            )
+            chunk_task_ids.append(this_task_id)
+        if len(chunk_task_ids) > 1:
+            self.chunks[chunk_task_ids[0]] = chunk_task_ids
+        self.wait_queue.append(chunk_task_ids[0])
+        self.n_queued += 1
+        if (self.dispatch_threshold is not None) and (
+            self.n_queued >= self.dispatch_threshold
+        ):
+            self.flush()
+        return chunk_task_ids
+
+    def flush(self) -> List[Union[int, Any]]:
+        """
+        Receive pending messages and submit waiting calls to ready workers,
+        without waiting for messages.
+
+        :return object: ids of waiting calls submitted to workers.
+        """
+        return self.process(block=False)
+
     def submit_waiting(self) -> List[Union[int, Any]]:
         """
         Submit waiting tasks if workers are available.
@@ -539,14 +867,16 @@ class MPIController(object):
         :return object: ids of calls, to be used in get_result().
         """
         task_ids = []
+        self.n_queued = 0
         if self.workers_available:
             if (len(self.waiting) > 0) and len(self.ready_workers) > 0:
                 reqs = []
                 status = []
                 for i in range(len(self.ready_workers)):
-                    if len(self.waiting) == 0:
+                    if len(self.wait_queue) == 0:
                         break
-                    task_id = self.wait_queue.pop(0)
+                    task_id = self.wait_queue.popleft()
+                    chunk_task_ids = self.chunks.pop(task_id, [task_id])
                     (
                         name_to_call,
                         args,
@@ -558,36 +888,65 @@ class MPIController(object):
                     if (requested_worker is None) or (
                         requested_worker not in self.ready_workers
                     ):
-                        ready_total_time_est = np.asarray(
-                            [
-                                self.total_time_est[worker]
-                                for worker in self.ready_workers
-                            ]
-                        )
-                        worker = self.ready_workers[np.argmin(ready_total_time_est)]
+                        worker = self.ready_workers.peek()
                     else:
                         worker = requested_worker
 
                     # send name to call, args, time_est to worker:
-                    logger.info(
-                        f"MPI controller : assigning waiting call with id {task_id} "
-                        f"to worker {worker}: {name_to_call} {args} {kwargs} ..."
-                    )
-                    req = self.comm.isend(
-                        (name_to_call, args, kwargs, module_name, time_est, task_id),
-                        dest=worker,
-                        tag=MessageTag.TASK.value,
-                    )
+                    if len(chunk_task_ids) == 1:
+                        logger.info(
+                            f"MPI controller : assigning waiting call with id "
+                            f"{task_id} to worker {worker}: "
+                            f"{name_to_call} {args} {kwargs} ..."
+                        )
+                        req = self.comm.isend(
+                            (
+                                name_to_call,
+                                args,
+                                kwargs,
+                                module_name,
+                                time_est,
+                                task_id,
+                            ),
+                            dest=worker,
+                            tag=MessageTag.TASK.value,
+                        )
+                    else:
+                        logger.info(
+                            f"MPI controller : assigning chunk of "
+                            f"{len(chunk_task_ids)} waiting calls with ids "
+                            f"{chunk_task_ids} to worker {worker}: {name_to_call} ..."
+                        )
+                        chunk = []
+                        for chunk_task_id in chunk_task_ids:
+                            (
+                                name_to_call,
+                                args,
+                                kwargs,
+                                module_name,
+                                time_est,
+                                _,
+                            ) = self.waiting[chunk_task_id]
+                            chunk.append(
+                                (
+                                    name_to_call,
+                                    args,
+                                    kwargs,
+                                    module_name,
+                                    time_est,
+                                    chunk_task_id,
+                                )
+                            )
+                        req = self.comm.isend(
+                            chunk, dest=worker, tag=MessageTag.TASK_CHUNK.value
+                        )
                     reqs.append(req)
                     status.append(MPI.Status())
-                    self.ready_workers.remove(worker)
-                    del self.ready_workers_data[worker]
-                    self.task_queue.append(task_id)
-                    self.worker_queue[worker].append(task_id)
-                    self.assigned[task_id] = worker
-                    del self.waiting[task_id]
-                    self.total_time_est[worker] += time_est
-                    task_ids.append(task_id)
+                    self._take_ready_worker(worker)
+                    for chunk_task_id in chunk_task_ids:
+                        time_est = self.waiting.pop(chunk_task_id)[4]
+                        self._assign_task(chunk_task_id, worker, time_est)
+                        task_ids.append(chunk_task_id)
                 MPI.Request.waitall(reqs, status)
         return task_ids
 
@@ -600,11 +959,14 @@ class MPIController(object):
         time_est: int = 1,
         task_ids: Optional[int] = None,
         workers: Optional[int] = None,
+        chunksize: int = 1,
     ) -> List[int]:
         """Submit multiple calls for parallel execution.
 
         Analogous to submit_call, but accepts lists of arguments and
-        submits to multiple workers for asynchronous execution.
+        submits to multiple workers for asynchronous execution. The
+        calls are put on the wait queue and submitted to ready workers
+        in one batch.
 
         If called by a worker or if no workers are available, the call is instead
         executed synchronously on this MPI node.
@@ -632,6 +994,9 @@ class MPIController(object):
         :arg  worker: optional worker ids to assign the tasks to. If None, the
             tasks are assigned in order to the workers with the smallest
             current total time estimate. Default: None
+        :arg int chunksize: number of calls sent to a worker in one task
+            message (see queue_chunk()). A chunk is assigned to the worker
+            requested for its first call. Default: 1
         :return object: id of call, to be used in get_result().
 
         """
@@ -640,24 +1005,38 @@ class MPIController(object):
         submitted_task_ids = []
         N = len(args) if (len(args) > 0) else len(kwargs)
         if self.workers_available:
-            self.process()
             args, kwargs, task_ids, workers = multiple_task_arguments(
                 N, args, kwargs, task_ids, workers
             )
-            for this_args, this_kwargs, this_task_id, this_worker in zip(
-                args, kwargs, task_ids, workers
-            ):
-                self.check_valid_task_id(this_task_id)
-                this_task_id = self.queue_call(
-                    name_to_call,
-                    args=this_args,
-                    kwargs=this_kwargs,
-                    module_name=module_name,
-                    time_est=time_est,
-                    task_id=this_task_id,
-                    requested_worker=this_worker,
-                )
-                submitted_task_ids.append(this_task_id)
+            if chunksize > 1:
+                for i in range(0, N, chunksize):
+                    submitted_task_ids.extend(
+                        self.queue_chunk(
+                            name_to_call,
+                            args[i : i + chunksize],
+                            kwargs[i : i + chunksize],
+                            module_name=module_name,
+                            time_est=time_est,
+                            task_ids=task_ids[i : i + chunksize],
+                            requested_worker=workers[i],
+                        )
+                    )
+            else:
+                for this_args, this_kwargs, this_task_id, this_worker in zip(
+                    args, kwargs, task_ids, workers
+                ):
+                    self.check_valid_task_id(this_task_id)
+                    this_task_id = self.queue_call(
+                        name_to_call,
+                        args=this_args,
+                        kwargs=this_kwargs,
+                        module_name=module_name,
+                        time_est=time_est,
+                        task_id=this_task_id,
+                        requested_worker=this_worker,
+                    )
+                    submitted_task_ids.append(this_task_id)
+            self.flush()
         else:
             # perform call on this rank if no workers are available:
             worker = 0
@@ -685,7 +1064,7 @@ class MPIController(object):
                 self.check_valid_task_id(this_task_id)
                 call_time = time.time()
                 self.results[this_task_id] = object_to_call(*this_args, **this_kwargs)
-                self.result_queue.append(this_task_id)
+                self.result_queue[this_task_id] = None
                 this_time = time.time() - call_time
                 self.n_processed[0] += 1
                 self.total_time[0] = time.time() - start_time
@@ -710,12 +1089,9 @@ class MPIController(object):
         If there are no workers, or no worker is ready, returns (None, None)
         """
         if self.workers_available:
-            self.process()
+            self.process(block=False)
             if len(self.ready_workers) > 0:
-                ready_total_time_est = np.asarray(
-                    [self.total_time_est[worker] for worker in self.ready_workers]
-                )
-                worker = self.ready_workers[np.argmin(ready_total_time_est)]
+                worker = self.ready_workers.peek()
                 return worker, self.ready_workers_data[worker]
             else:
                 return None, None
@@ -747,12 +1123,15 @@ class MPIController(object):
         """
         if task_id in self.results:
             return task_id, self.results[task_id]
-        source = self.assigned[task_id]
-        if self.workers_available:
-            if self.worker_queue[source][0] != task_id:
+        # a call on the wait queue must be submitted to a worker first:
+        while task_id in self.waiting:
+            self.process()
+        if self.workers_available and (task_id not in self.results):
+            source = self.assigned[task_id]
+            next_task_id = next(iter(self.worker_queue[source]))
+            if next_task_id != task_id:
                 raise RuntimeError(
-                    f"get_result({task_id})) called before get_result("
-                    f"{self.worker_queue[source][0]})"
+                    f"get_result({task_id})) called before get_result({next_task_id})"
                 )
             logger.info(
                 f"MPI controller : retrieving result for call with id {task_id} "
@@ -772,7 +1151,7 @@ class MPIController(object):
                 f"MPI controller : returning result for call with id {task_id} ..."
             )
         result = self.results[task_id]
-        self.result_queue.remove(task_id)
+        del self.result_queue[task_id]
         return task_id, result
 
     def get_next_result(
@@ -795,12 +1174,19 @@ class MPIController(object):
         :return: id, return value of call, or None of there are no more calls in
                  the queue.
         """
-        self.process()
+        self.process(block=False)
+        # calls that are only waiting need a READY message to be submitted:
+        while (
+            (len(self.result_queue) == 0)
+            and (len(self.task_queue) == 0)
+            and self.expecting_messages()
+        ):
+            self.process()
         if len(self.result_queue) > 0:
-            task_id = self.result_queue.pop(0)
+            task_id, _ = self.result_queue.popitem(last=False)
             return task_id, self.results[task_id]
         elif len(self.task_queue) > 0:
-            task_id = self.task_queue[0]
+            task_id = next(iter(self.task_queue))
             return task_id, self.get_result(task_id)[1]
         else:
             return None
@@ -817,9 +1203,9 @@ class MPIController(object):
         :rtype:  object
         :return: id, return value of call, or None of there are no results ready.
         """
-        self.process()
+        self.process(block=False)
         if len(self.result_queue) > 0:
-            task_id = self.result_queue.pop(0)
+            task_id, _ = self.result_queue.popitem(last=False)
             logger.info(
                 f"MPI controller : received result for call with id {task_id} ..."
             )
@@ -839,11 +1225,11 @@ class MPIController(object):
         :rtype:  object
         :return: list of id, return value of call
         """
-        self.process()
+        self.process(block=False)
         ret = []
         if len(self.result_queue) > 0:
             for i in range(len(self.result_queue)):
-                task_id = self.result_queue.pop(0)
+                task_id, _ = self.result_queue.popitem(last=False)
                 logger.info(
                     f"MPI controller : received result for call with id {task_id} ..."
                 )
@@ -900,6 +1286,8 @@ class MPIController(object):
                 f"{self.total_time.std():.04f}\n"
                 "     coeff. of var. of actual over estd. time per worker: "
                 f"{cvar_worker_quotients:.04f}\n"
+                "     controller time waiting for messages: "
+                f"{self.total_wait_time:.04f}\n"
             )
         else:
             print(
@@ -961,7 +1349,12 @@ class MPIController(object):
 
 class MPIWorker(object):
     def __init__(
-        self, comm: Intracomm, group_comm: Intracomm, ready_data: Optional[Any] = None
+        self,
+        comm: Intracomm,
+        group_comm: Intracomm,
+        ready_data: Optional[Any] = None,
+        wait_strategy: WaitStrategy = WaitStrategy.Blocking,
+        backoff_max: float = 0.01,
     ) -> None:
         size = comm.size
         rank = comm.rank
@@ -969,6 +1362,8 @@ class MPIWorker(object):
         self.comm = comm
         self.group_comm = group_comm
         self.worker_id = group_comm.rank + 1
+        self.wait_strategy = wait_strategy
+        self.backoff_max = backoff_max
         self.total_time_est = np.zeros(size) * np.nan
         self.total_time_est[rank] = 0
         self.n_processed = np.zeros(size) * np.nan
@@ -1001,66 +1396,77 @@ class MPIWorker(object):
         logger.info(f"MPI worker {rank}: waiting for calls.")
 
         # wait for orders:
-        ready = True
         status = MPI.Status()
         exit_flag = False
         while not exit_flag:
             # signal the controller this worker is ready
-            if ready:
-                req = self.comm.isend(
-                    self.ready_data, dest=0, tag=MessageTag.READY.value
-                )
-                req.wait()
+            req = self.comm.isend(self.ready_data, dest=0, tag=MessageTag.READY.value)
+            req.wait()
 
-            # get next task from queue:
-            if self.comm.Iprobe(source=0, tag=MPI.ANY_TAG):
-                data = self.comm.recv(source=0, tag=MPI.ANY_TAG, status=status)
-                tag = status.Get_tag()
-
-                # TODO: add timeout and check whether controller lives!
-                object_to_call = None
-                if tag == MessageTag.EXIT.value:
-                    logger.info(f"MPI worker {self.worker_id}: exiting...")
-                    exit_flag = True
-                    break
-                elif tag == MessageTag.TASK.value:
-                    try:
-                        (name_to_call, args, kwargs, module, time_est, task_id) = data
-                        if module not in sys.modules:
-                            importlib.import_module(module)
-                        object_to_call = eval(
-                            name_to_call, sys.modules[module].__dict__
-                        )
-                    except NameError:
-                        logger.error(str(sys.modules[module].__dict__.keys()))
-                        raise
-                else:
-                    raise RuntimeError(
-                        f"MPI worker {self.worker_id}: unknown message tag {tag}"
-                    )
-                self.total_time_est[rank] += time_est
-                call_time = time.time()
-                result = object_to_call(*args, **kwargs)
-                this_time = time.time() - call_time
-                self.n_processed[rank] += 1
-                self.stats.append(
-                    {
-                        "id": task_id,
-                        "rank": rank,
-                        "this_time": this_time,
-                        "time_over_est": this_time / time_est,
-                        "n_processed": self.n_processed[rank],
-                        "total_time": time.time() - start_time,
-                    }
-                )
-                req = self.comm.isend(
-                    (task_id, result, self.stats[-1]), dest=0, tag=MessageTag.DONE.value
-                )
-                req.wait()
-                ready = True
+            # wait for the next task from the controller:
+            msg = wait_for_message(
+                self.comm,
+                source=0,
+                tag=MPI.ANY_TAG,
+                status=status,
+                wait_strategy=self.wait_strategy,
+                backoff_max=self.backoff_max,
+            )
+            data = msg.recv()
+            tag = status.Get_tag()
+
+            # TODO: add timeout and check whether controller lives!
+            if tag == MessageTag.EXIT.value:
+                logger.info(f"MPI worker {self.worker_id}: exiting...")
+                exit_flag = True
+                break
+            elif tag == MessageTag.TASK.value:
+                done = self.run_task(data)
+                done_tag = MessageTag.DONE.value
+            elif tag == MessageTag.TASK_CHUNK.value:
+                # run the calls of a chunk back to back and return one message
+                done = [self.run_task(task) for task in data]
+                done_tag = MessageTag.DONE_CHUNK.value
             else:
-                ready = False
-                time.sleep(1)
+                raise RuntimeError(
+                    f"MPI worker {self.worker_id}: unknown message tag {tag}"
+                )
+            req = self.comm.isend(done, dest=0, tag=done_tag)
+            req.wait()
+
+    def run_task(
+        self, task: Tuple[str, Tuple[Any], Dict[Any, Any], str, int, int]
+    ) -> Tuple[int, Any, Dict[str, Any]]:
+        """
+        Perform a call received from the controller and return its id,
+        result and statistics.
+        """
+        rank = self.comm.rank
+        object_to_call = None
+        try:
+            (name_to_call, args, kwargs, module, time_est, task_id) = task
+            if module not in sys.modules:
+                importlib.import_module(module)
+            object_to_call = eval(name_to_call, sys.modules[module].__dict__)
+        except NameError:
+            logger.error(str(sys.modules[module].__dict__.keys()))
+            raise
+        self.total_time_est[rank] += time_est
+        call_time = time.time()
+        result = object_to_call(*args, **kwargs)
+        this_time = time.time() - call_time
+        self.n_processed[rank] += 1
+        self.stats.append(
+            {
+                "id": task_id,
+                "rank": rank,
+                "this_time": this_time,
+                "time_over_est": this_time / time_est,
+                "n_processed": self.n_processed[rank],
+                "total_time": time.time() - start_time,
+            }
+        )
+        return task_id, result, self.stats[-1]
 
     def abort(self):
         traceback.print_exc()
@@ -1284,6 +1690,8 @@ class MPICollectiveBroker(object):
         ready_data: Optional[Any] = None,
         is_worker: bool = False,
         collective_mode: CollectiveMode = CollectiveMode.Gather,
+        wait_strategy: WaitStrategy = WaitStrategy.Blocking,
+        backoff_max: float = 0.01,
     ) -> None:
         logger.info(f"MPI collective broker {worker_id} starting")
         assert not spawned
@@ -1294,6 +1702,8 @@ class MPICollectiveBroker(object):
         merged_rank = merged_comm.rank
 
         self.collective_mode = collective_mode
+        self.wait_strategy = wait_strategy
+        self.backoff_max = backoff_max
         self.comm = comm
         self.group_comm = group_comm
         self.merged_comm = merged_comm
@@ -1330,9 +1740,6 @@ class MPICollectiveBroker(object):
         If you don't define workerfun(), serve() will be called automatically by
         run().
         """
-        rank = self.comm.rank
-        merged_rank = self.merged_comm.Get_rank()
-
         logger.info(f"MPI collective broker {self.worker_id}: waiting for calls.")
 
         # wait for orders:
@@ -1361,76 +1768,88 @@ class MPICollectiveBroker(object):
                 self.scatter_task("exit", (), {}, "", 0, 0)
                 break
             elif tag == MessageTag.TASK.value:
-                (name_to_call, args, kwargs, module, time_est, task_id) = data
+                done = self.run_task(data)
+                done_tag = MessageTag.DONE.value
+            elif tag == MessageTag.TASK_CHUNK.value:
+                # relay the calls of a chunk one by one and return one message
+                done = [self.run_task(task) for task in data]
+                done_tag = MessageTag.DONE_CHUNK.value
             else:
                 raise RuntimeError(f"MPI collective broker: unknown message tag {tag}")
 
             logger.info(
                 f"MPI collective broker {self.worker_id}: "
-                f"sending task {task_id} to workers..."
-            )
-            self.scatter_task(name_to_call, args, kwargs, module, time_est, task_id)
-            logger.info(
-                f"MPI collective broker {self.worker_id}: sending task complete."
+                "sending results to controller..."
             )
+            req = self.comm.isend(done, dest=0, tag=done_tag)
+            req.wait()
 
-            self.total_time_est[rank] += time_est
-            if self.is_worker:
-                object_to_call = None
-                try:
-                    if module not in sys.modules:
-                        importlib.import_module(module)
-                    object_to_call = eval(name_to_call, sys.modules[module].__dict__)
-                except NameError:
-                    logger.error(str(sys.modules[module].__dict__.keys()))
-                    raise
+    def run_task(
+        self, task: Tuple[str, Tuple[Any], Dict[Any, Any], str, int, int]
+    ) -> Tuple[int, List[Any], Optional[Dict[str, Any]]]:
+        """
+        Send a call received from the controller to the collective
+        workers, perform it on this rank as well if the broker is a
+        worker, and return its id, the gathered results and the
+        statistics of the slowest rank.
+        """
+        rank = self.comm.rank
+        merged_rank = self.merged_comm.Get_rank()
+        (name_to_call, args, kwargs, module, time_est, task_id) = task
 
-                call_time = time.time()
-                try:
-                    this_result = object_to_call(*args, **kwargs)
-                except Exception as e:
-                    logger.error(
-                        f"MPI collective broker {self.worker_id}: "
-                        f"call to {name_to_call} failed with error: {e}"
-                    )
-                    raise
+        logger.info(
+            f"MPI collective broker {self.worker_id}: "
+            f"sending task {task_id} to workers..."
+        )
+        self.scatter_task(name_to_call, args, kwargs, module, time_est, task_id)
+        logger.info(f"MPI collective broker {self.worker_id}: sending task complete.")
 
-                this_time = time.time() - call_time
-                self.n_processed[merged_rank] += 1
-                this_stat = {
-                    "id": task_id,
-                    "rank": merged_rank,
-                    "this_time": this_time,
-                    "time_over_est": this_time / time_est,
-                    "n_processed": self.n_processed[merged_rank],
-                    "total_time": time.time() - start_time,
-                }
-            else:
-                this_result = None
-                this_stat = None
-                this_time = 0
+        self.total_time_est[rank] += time_est
+        if self.is_worker:
+            object_to_call = None
+            try:
+                if module not in sys.modules:
+                    importlib.import_module(module)
+                object_to_call = eval(name_to_call, sys.modules[module].__dict__)
+            except NameError:
+                logger.error(str(sys.modules[module].__dict__.keys()))
+                raise
 
-            logger.info(
-                f"MPI collective broker {self.worker_id}: "
-                "gathering data from workers..."
-            )
-            results, stats = self.gather_results(this_result, this_stat)
+            call_time = time.time()
+            try:
+                this_result = object_to_call(*args, **kwargs)
+            except Exception as e:
+                logger.error(
+                    f"MPI collective broker {self.worker_id}: "
+                    f"call to {name_to_call} failed with error: {e}"
+                )
+                raise
 
-            stat_times = np.asarray([stat["this_time"] for stat in stats])
-            max_time = 0.0
-            if len(stat_times) > 0:
-                max_time = np.argmax(stat_times)
-                stat = stats[max_time]
-            else:
-                stat = None
-            logger.info(
-                f"MPI collective broker {self.worker_id}: "
-                "sending results to controller..."
-            )
-            req = self.comm.isend(
-                (task_id, results, stat), dest=0, tag=MessageTag.DONE.value
-            )
-            req.wait()
+            this_time = time.time() - call_time
+            self.n_processed[merged_rank] += 1
+            this_stat = {
+                "id": task_id,
+                "rank": merged_rank,
+                "this_time": this_time,
+                "time_over_est": this_time / time_est,
+                "n_processed": self.n_processed[merged_rank],
+                "total_time": time.time() - start_time,
+            }
+        else:
+            this_result = None
+            this_stat = None
+
+        logger.info(
+            f"MPI collective broker {self.worker_id}: gathering data from workers..."
+        )
+        results, stats = self.gather_results(this_result, this_stat)
+
+        stat_times = np.asarray([stat["this_time"] for stat in stats])
+        if len(stat_times) > 0:
+            stat = stats[np.argmax(stat_times)]
+        else:
+            stat = None
+        return task_id, results, stat
 
     def scatter_task(
         self,
@@ -1512,22 +1931,34 @@ class MPICollectiveBroker(object):
         return results, stats
 
     def process(
-        self,
+        self, timeout: Optional[float] = None
     ) -> Optional[
         Union[
             Tuple[int, None],
             Tuple[int, Tuple[str, Tuple[int], Dict[Any, Any], str, int, int]],
         ]
     ]:
+        """
+        Wait for the next message from the controller according to the
+        wait strategy of the broker, and return its tag and data, or
+        None if no message arrived within timeout seconds.
+        """
         status = MPI.Status()
-        if self.comm.Iprobe(source=0, tag=MPI.ANY_TAG):
-            # get next task from controller queue:
-            data = self.comm.recv(source=0, tag=MPI.ANY_TAG, status=status)
-            tag = status.Get_tag()
-            return tag, data
-        else:
-            time.sleep(1)
+        msg = wait_for_message(
+            self.comm,
+            source=0,
+            tag=MPI.ANY_TAG,
+            status=status,
+            wait_strategy=self.wait_strategy,
+            backoff_max=self.backoff_max,
+            timeout=timeout,
+        )
+        if msg is None:
             return None
+        # get next task from controller queue:
+        data = msg.recv()
+        tag = status.Get_tag()
+        return tag, data
 
     def abort(self):
         rank = self.comm.rank
@@ -1750,6 +2181,20 @@ def check_worker_grouping_method(worker_grouping_method):
         return worker_grouping_method
 
 
+def check_wait_strategy(wait_strategy):
+    if isinstance(wait_strategy, str):
+        if wait_strategy.lower() == "busypoll":
+            return WaitStrategy.BusyPoll
+        elif wait_strategy.lower() == "backoff":
+            return WaitStrategy.Backoff
+        elif wait_strategy.lower() == "blocking":
+            return WaitStrategy.Blocking
+        else:
+            raise RuntimeError(f"Unknown wait strategy {wait_strategy}")
+    else:
+        return wait_strategy
+
+
 def check_spawn_config(
     spawn_workers: bool,
     nprocs_per_worker: int,
@@ -1838,6 +2283,8 @@ def run_spawn_group(
     sequential_spawn,
     spawn_startup_wait,
     spawn_executable,
+    wait_strategy,
+    backoff_max,
     verbose,
 ):
     check_spawn_config(
@@ -1874,6 +2321,8 @@ def run_spawn_group(
         nprocs_per_worker,
         is_worker=broker_is_worker,
         collective_mode=collective_mode_arg,
+        wait_strategy=wait_strategy,
+        backoff_max=backoff_max,
     )
     if fun is not None:
         req = merged_comm.Ibarrier()
@@ -1903,6 +2352,8 @@ def run_split_group(
     controller_worker_comm,
     group_comm,
     collective_mode,
+    wait_strategy,
+    backoff_max,
     verbose,
 ):
     broker = None
@@ -1940,6 +2391,8 @@ def run_split_group(
             nprocs_per_worker,
             is_worker=broker_is_worker,
             collective_mode=collective_mode_arg,
+            wait_strategy=wait_strategy,
+            backoff_max=backoff_max,
         )
         req = controller_worker_comm.Ibarrier()
         req.wait()
@@ -1985,6 +2438,10 @@ def run(
     worker_service_name: str = "distwq.init",
     enable_worker_service: bool = False,
     time_limit: Optional[int] = None,
+    wait_strategy: Union[str, WaitStrategy] = WaitStrategy.Backoff,
+    worker_wait_strategy: Union[str, WaitStrategy] = WaitStrategy.Blocking,
+    backoff_max: float = 0.01,
+    dispatch_threshold: Optional[int] = None,
     verbose: bool = False,
     args: Tuple[Any] = (),
 ) -> None:
@@ -2028,6 +2485,26 @@ def run(
 
     :arg time_limit: maximum wall clock time, in seconds
 
+    :arg WaitStrategy wait_strategy: how the controller waits for
+    messages from workers when none is pending: BusyPoll (probe
+    continuously), Backoff (default; probe with exponentially
+    increasing delay) or Blocking (blocking matched probe).
+
+    :arg WaitStrategy worker_wait_strategy: how workers and brokers
+    wait for the next message from the controller. The default,
+    Blocking, starts a task as soon as it arrives; note that many MPI
+    implementations spin inside a blocking probe, so an idle worker
+    keeps its core busy. Use Backoff on oversubscribed nodes, at the
+    cost of up to backoff_max seconds of dispatch latency.
+
+    :arg float backoff_max: maximum delay between probes, in seconds,
+    for the Backoff wait strategy
+
+    :arg int dispatch_threshold: if not None, submit_call() on the
+    controller only puts calls on the wait queue, and waiting calls
+    are submitted to workers in batches, when the wait queue reaches
+    this length or when the controller calls flush()
+
     :arg args: additional args to pass to fun
 
     """
@@ -2038,6 +2515,8 @@ def run(
     assert not spawned
 
     worker_grouping_method = check_worker_grouping_method(worker_grouping_method)
+    wait_strategy = check_wait_strategy(wait_strategy)
+    worker_wait_strategy = check_wait_strategy(worker_wait_strategy)
 
     global n_workers, is_worker
     if max_workers > 0:
@@ -2076,7 +2555,13 @@ def run(
                 controller_worker_comm = world_comm.Split(
                     color, key=0 if is_controller else 1
                 )
-            controller = MPIController(controller_worker_comm, time_limit=time_limit)
+            controller = MPIController(
+                controller_worker_comm,
+                time_limit=time_limit,
+                wait_strategy=wait_strategy,
+                backoff_max=backoff_max,
+                dispatch_threshold=dispatch_threshold,
+            )
             signal.signal(signal.SIGINT, lambda signum, frame: controller.abort())
             req = controller_worker_comm.Ibarrier()
             req.wait()
@@ -2112,6 +2597,8 @@ def run(
                 sequential_spawn,
                 spawn_startup_wait,
                 spawn_executable,
+                worker_wait_strategy,
+                backoff_max,
                 verbose,
             )
         elif is_worker and split_workers:  # I'm a broker or a worker
@@ -2145,6 +2632,8 @@ def run(
                 controller_worker_comm,
                 group_comm,
                 collective_mode,
+                worker_wait_strategy,
+                backoff_max,
                 verbose,
             )
 
@@ -2152,7 +2641,12 @@ def run(
             worker_id = rank
             req = world_comm.Ibarrier()
             req.wait()
-            worker = MPIWorker(world_comm, group_comm)
+            worker = MPIWorker(
+                world_comm,
+                group_comm,
+                wait_strategy=worker_wait_strategy,
+                backoff_max=backoff_max,
+            )
             if fun is not None:
                 fun(worker, *args)
             worker.serve()
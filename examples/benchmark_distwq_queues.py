@@ -0,0 +1,77 @@
+# Benchmark of the per-call bookkeeping overhead of the distwq controller.
+# PYTHONPATH must include the directory in which distwq is located.
+#
+# Run with at least two MPI processes, e.g.
+#
+#   mpirun -n 2 python benchmark_distwq_queues.py 7
+#
+# to measure 10^3 .. 10^7 queued calls. Rank 0 queues the calls and
+# moves each of them through the controller bookkeeping (dispatch to a
+# ready worker, DONE message, result retrieval) without exchanging
+# messages, so that only the controller data structures are measured.
+# The other ranks wait at a barrier.
+
+import sys
+import time
+
+from mpi4py import MPI
+
+import distwq
+
+
+def benchmark(n_tasks, n_workers):
+    controller = distwq.MPIController(MPI.COMM_WORLD)
+    times = {}
+
+    t = time.perf_counter()
+    for i in range(n_tasks):
+        controller.queue_call("noop", (i,))
+    times["submit"] = time.perf_counter() - t
+
+    t = time.perf_counter()
+    for i in range(n_tasks):
+        worker = (i % n_workers) + 1
+        controller.ready_workers.push(worker, controller.total_time_est[worker])
+        controller.ready_workers_data[worker] = None
+        task_id = controller.wait_queue.popleft()
+        del controller.waiting[task_id]
+        controller._take_ready_worker(worker)
+        controller._assign_task(task_id, worker, 1)
+    times["dispatch"] = time.perf_counter() - t
+
+    t = time.perf_counter()
+    for i in range(n_tasks):
+        worker = (i % n_workers) + 1
+        stats = {"id": i, "n_processed": i, "total_time": 0.0}
+        controller._complete_task(worker, i, i, stats)
+    times["done"] = time.perf_counter() - t
+
+    t = time.perf_counter()
+    for i in range(n_tasks):
+        controller.get_next_result()
+    times["result"] = time.perf_counter() - t
+
+    return times
+
+
+def main():
+    max_exp = int(sys.argv[1]) if len(sys.argv) > 1 else 6
+    n_workers = MPI.COMM_WORLD.size - 1
+    phases = ["submit", "dispatch", "done", "result"]
+    print("per-call controller overhead (microseconds)")
+    print(f"{'calls':>10} " + " ".join(f"{phase:>10}" for phase in phases))
+    for exp in range(3, max_exp + 1):
+        n_tasks = 10**exp
+        times = benchmark(n_tasks, n_workers)
+        print(
+            f"{n_tasks:>10} "
+            + " ".join(f"{1e6 * times[phase] / n_tasks:>10.3f}" for phase in phases)
+        )
+
+
+if __name__ == "__main__":
+    if MPI.COMM_WORLD.size < 2:
+        raise RuntimeError("benchmark_distwq_queues.py needs at least 2 MPI processes")
+    if MPI.COMM_WORLD.rank == 0:
+        main()
+    MPI.COMM_WORLD.barrier()
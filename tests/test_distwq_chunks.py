@@ -0,0 +1,58 @@
+import numpy as np
+
+import distwq
+
+chunksize = 4
+
+
+def do_work(x):
+    return x**2
+
+
+def init(worker):
+    pass
+
+
+def main(controller):
+    n = 21
+    task_ids = controller.submit_multiple(
+        "do_work",
+        [(x,) for x in range(1, n + 1)],
+        module_name="test_distwq_chunks",
+        chunksize=chunksize,
+    )
+    assert len(task_ids) == n
+    s = {}
+    for i in range(0, n):
+        task_id, res = controller.get_next_result()
+        s[task_id] = res
+    assert controller.get_next_result() is None
+    assert sorted(s.keys()) == sorted(task_ids)
+    assert np.sum(list(s.values())) == sum(x**2 for x in range(1, n + 1))
+
+    # results and statistics are recorded per call
+    task_ids = controller.submit_multiple(
+        "do_work",
+        [(x,) for x in range(1, n + 1)],
+        module_name="test_distwq_chunks",
+        chunksize=chunksize,
+    )
+    for task_id, x in zip(task_ids, range(1, n + 1)):
+        assert controller.get_result(task_id) == (task_id, x**2)
+    assert len(controller.stats) == 2 * n
+    controller.info()
+
+
+def test_chunks():
+    if distwq.is_controller:
+        distwq.run(
+            fun_name="main",
+            module_name="test_distwq_chunks",
+            verbose=True,
+        )
+    else:
+        distwq.run(
+            fun_name="init",
+            module_name="test_distwq_chunks",
+            verbose=True,
+        )
@@ -0,0 +1,107 @@
+import numpy as np
+
+import distwq
+
+dispatch_threshold = 8
+
+
+def do_work(x):
+    return x**2
+
+
+def init(worker):
+    pass
+
+
+def main(controller):
+    n = 20
+    assert controller.dispatch_threshold == dispatch_threshold
+
+    if controller.workers_available:
+        # wait until the workers have reported ready
+        while controller.get_ready_worker() == (None, None):
+            pass
+
+        n_flush = [0]
+        flush = controller.flush
+
+        def counting_flush():
+            n_flush[0] += 1
+            return flush()
+
+        controller.flush = counting_flush
+
+        # calls are deferred until the threshold is reached
+        task_ids = []
+        for i in range(0, dispatch_threshold - 1):
+            task_ids.append(
+                controller.submit_call(
+                    "do_work", (i + 1,), module_name="test_distwq_dispatch"
+                )
+            )
+        assert len(controller.assigned) == 0
+        assert sorted(controller.waiting.keys()) == sorted(task_ids)
+        assert n_flush[0] == 0
+
+        # flush() returns the ids of the calls it submitted
+        flushed = controller.flush()
+        assert len(flushed) > 0
+        assert set(flushed) <= set(task_ids)
+        assert all(task_id in controller.assigned for task_id in flushed)
+
+        # one flush per dispatch_threshold queued calls, not one per call
+        n_flush[0] = 0
+        for i in range(dispatch_threshold - 1, n):
+            task_ids.append(
+                controller.submit_call(
+                    "do_work", (i + 1,), module_name="test_distwq_dispatch"
+                )
+            )
+        assert n_flush[0] == (n - dispatch_threshold + 1) // dispatch_threshold
+        controller.flush = flush
+    else:
+        task_ids = [
+            controller.submit_call(
+                "do_work", (i + 1,), module_name="test_distwq_dispatch"
+            )
+            for i in range(0, n)
+        ]
+
+    task_ids.extend(
+        controller.submit_multiple(
+            "do_work",
+            [(x,) for x in range(1, n + 1)],
+            module_name="test_distwq_dispatch",
+        )
+    )
+    s = {}
+    for i in range(0, 2 * n):
+        task_id, res = controller.get_next_result()
+        s[task_id] = res
+    assert controller.get_next_result() is None
+    assert sorted(s.keys()) == sorted(task_ids)
+    assert np.sum(list(s.values())) == 2 * sum(x**2 for x in range(1, n + 1))
+
+    # get_result right after submit_call, while the call is still deferred
+    task_id = controller.submit_call(
+        "do_work", (3,), module_name="test_distwq_dispatch"
+    )
+    assert controller.get_result(task_id) == (task_id, 9)
+    controller.info()
+
+
+def test_dispatch_threshold():
+    if distwq.is_controller:
+        distwq.run(
+            fun_name="main",
+            module_name="test_distwq_dispatch",
+            dispatch_threshold=dispatch_threshold,
+            verbose=True,
+        )
+    else:
+        distwq.run(
+            fun_name="init",
+            module_name="test_distwq_dispatch",
+            dispatch_threshold=dispatch_threshold,
+            verbose=True,
+        )
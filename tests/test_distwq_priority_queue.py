@@ -0,0 +1,35 @@
+import random
+
+from distwq import IndexedPriorityQueue
+
+
+def test_indexed_priority_queue():
+    rng = random.Random(17)
+    queue = IndexedPriorityQueue()
+    priorities = {}
+    for item in range(1, 101):
+        priorities[item] = rng.random()
+        queue.push(item, priorities[item])
+    assert len(queue) == 100
+
+    # update, including decrease-key, and removal by item
+    for item in rng.sample(sorted(priorities), 30):
+        priorities[item] = rng.random()
+        queue.update(item, priorities[item])
+    for item in rng.sample(sorted(priorities), 20):
+        queue.remove(item)
+        del priorities[item]
+    assert len(queue) == len(priorities)
+    assert all(item in queue for item in priorities)
+
+    order = []
+    while len(queue) > 0:
+        assert queue.peek() == min(priorities, key=priorities.get)
+        order.append(queue.pop())
+        del priorities[order[-1]]
+    assert len(order) == 80
+
+    # ties are returned in insertion order
+    for item in (3, 1, 2):
+        queue.push(item, 1.0)
+    assert [queue.pop() for _ in range(3)] == [3, 1, 2]
@@ -0,0 +1,78 @@
+import time
+
+import pytest
+
+import distwq
+
+timeout = 0.05
+task_time = 1.0
+
+
+def sleep_work(x):
+    time.sleep(task_time)
+    return x
+
+
+def init(worker):
+    pass
+
+
+def main(controller):
+    assert controller.wait_strategy == distwq.WaitStrategy.Backoff
+    assert controller.backoff_max == 0.001
+    if not controller.workers_available:
+        return
+
+    # wait until the workers have reported ready
+    while controller.get_ready_worker() == (None, None):
+        pass
+
+    task_id = controller.submit_call(
+        "sleep_work", (1,), module_name="test_distwq_wait_backoff"
+    )
+    # no message arrives while the call runs: process() returns after the timeout
+    start = time.time()
+    controller.process(timeout=timeout)
+    elapsed = time.time() - start
+    assert task_id in controller.task_queue
+    assert elapsed < task_time
+    assert timeout <= controller.last_wait_time < task_time
+    assert controller.total_wait_time >= controller.last_wait_time
+
+    total_wait_time = controller.total_wait_time
+    assert controller.get_result(task_id) == (task_id, 1)
+    assert controller.total_wait_time > total_wait_time
+    controller.info()
+
+
+def test_check_wait_strategy():
+    assert distwq.check_wait_strategy("busypoll") == distwq.WaitStrategy.BusyPoll
+    assert distwq.check_wait_strategy("Backoff") == distwq.WaitStrategy.Backoff
+    assert distwq.check_wait_strategy("BLOCKING") == distwq.WaitStrategy.Blocking
+    assert (
+        distwq.check_wait_strategy(distwq.WaitStrategy.Blocking)
+        == distwq.WaitStrategy.Blocking
+    )
+    with pytest.raises(RuntimeError):
+        distwq.check_wait_strategy("sleep")
+
+
+def test_wait_backoff():
+    if distwq.is_controller:
+        distwq.run(
+            fun_name="main",
+            module_name="test_distwq_wait_backoff",
+            wait_strategy="backoff",
+            worker_wait_strategy=distwq.WaitStrategy.Backoff,
+            backoff_max=0.001,
+            verbose=True,
+        )
+    else:
+        distwq.run(
+            fun_name="init",
+            module_name="test_distwq_wait_backoff",
+            wait_strategy="backoff",
+            worker_wait_strategy=distwq.WaitStrategy.Backoff,
+            backoff_max=0.001,
+            verbose=True,
+        )
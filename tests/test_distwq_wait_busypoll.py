@@ -0,0 +1,49 @@
+import numpy as np
+
+import distwq
+
+
+def do_work(x):
+    return x**2
+
+
+def init(worker):
+    pass
+
+
+def main(controller):
+    n = 20
+    if controller.workers_available:
+        assert controller.wait_strategy == distwq.WaitStrategy.BusyPoll
+    task_ids = [
+        controller.submit_call("do_work", (x,), module_name="test_distwq_wait_busypoll")
+        for x in range(1, n + 1)
+    ]
+    s = {}
+    for i in range(0, n):
+        task_id, res = controller.get_next_result()
+        s[task_id] = res
+    assert controller.get_next_result() is None
+    assert sorted(s.keys()) == sorted(task_ids)
+    assert np.sum(list(s.values())) == sum(x**2 for x in range(1, n + 1))
+    assert controller.total_wait_time >= 0.0
+    controller.info()
+
+
+def test_wait_busypoll():
+    if distwq.is_controller:
+        distwq.run(
+            fun_name="main",
+            module_name="test_distwq_wait_busypoll",
+            wait_strategy="busypoll",
+            worker_wait_strategy="BusyPoll",
+            verbose=True,
+        )
+    else:
+        distwq.run(
+            fun_name="init",
+            module_name="test_distwq_wait_busypoll",
+            wait_strategy="busypoll",
+            worker_wait_strategy="BusyPoll",
+            verbose=True,
+        )